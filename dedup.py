@@ -0,0 +1,227 @@
+import gc
+import json
+import math
+import re
+import unicodedata
+
+CANONICAL_IDS_FILE = 'anime_canonical_ids.json'
+
+# Minimal kemiripan Jaccard (token judul) untuk dianggap show yang sama
+SIMILARITY_THRESHOLD = 0.8
+
+# Varian penulisan season/part disamakan ke satu bentuk (s2, p2)
+SEASON_PATTERNS = [
+    (re.compile(r'\b(\d+)(?:st|nd|rd|th)\s+season\b'), r' s\1 '),
+    (re.compile(r'\bseason\s+(\d+)\b'), r' s\1 '),
+    (re.compile(r'\b(\d+)(?:st|nd|rd|th)\s+(?:part|cour)\b'), r' p\1 '),
+    (re.compile(r'\b(?:part|cour)\s+(\d+)\b'), r' p\1 '),
+]
+SEASON_HINT_PATTERN = re.compile(r'season|part|cour')
+NON_WORD_PATTERN = re.compile(r'[^\w]+')
+SLUG_HASH_PATTERN = re.compile(r'-[0-9a-f]{4}$')
+DIGIT_PATTERN = re.compile(r'\d')
+
+
+def normalize_title(title):
+    """
+    Normalisasi judul: huruf kecil, tanpa aksen/tanda baca, dan penanda
+    season/part disamakan (mis. '2nd Season' dan 'Season 2' jadi 's2').
+    Penanda tipe seperti '(TV)'/'(OVA)' tetap jadi token.
+    """
+    if not title:
+        return ''
+
+    if not title.isascii():
+        title = unicodedata.normalize('NFKD', title)
+        title = ''.join(ch for ch in title if not unicodedata.combining(ch))
+    title = title.lower()
+    title = NON_WORD_PATTERN.sub(' ', title)
+    if SEASON_HINT_PATTERN.search(title):
+        for pattern, replacement in SEASON_PATTERNS:
+            title = pattern.sub(replacement, title)
+    return ' '.join(title.split())
+
+
+def slug_to_title(slug):
+    """Ubah slug ke judul (tanpa suffix id hash di akhir slug)."""
+    if not slug:
+        return ''
+    return SLUG_HASH_PATTERN.sub('', slug.strip('/').lower()).replace('-', ' ')
+
+
+def title_variants(record, slug_title=None):
+    """Semua varian judul ter-normalisasi dari satu record."""
+    if slug_title is None:
+        slug_title = slug_to_title(record.get('slug'))
+
+    variants = set()
+    for title in (record.get('judul'), record.get('judul_english'), slug_title):
+        normalized = normalize_title(title)
+        if normalized:
+            variants.add(normalized)
+    return variants
+
+
+def record_key(record):
+    """Id record: slug, atau url_detail kalau slug kosong."""
+    return record.get('slug') or record.get('url_detail') or ''
+
+
+def record_richness(record):
+    """Jumlah field yang terisi, untuk memilih record kanonik."""
+    return sum(1 for k, v in record.items() if v and k != 'scraped_at')
+
+
+def _find(parent, i):
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def _union(parent, a, b):
+    root_a, root_b = _find(parent, a), _find(parent, b)
+    if root_a != root_b:
+        parent[root_b] = root_a
+
+
+def _numeric_tokens(tokens):
+    return frozenset(token for token in tokens if DIGIT_PATTERN.search(token))
+
+
+def _normalize_year(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def find_duplicate_groups(records, threshold=SIMILARITY_THRESHOLD):
+    """
+    Kelompokkan index record yang merupakan show yang sama.
+
+    Dua record hanya boleh digabung kalau tipe dan token angkanya
+    (season/part/tahun di judul) sama. Record beda tahun hanya digabung
+    lewat slug yang persis sama (termasuk suffix hash, yang membedakan
+    remake berjudul sama); kemiripan judul, termasuk slug tanpa hash,
+    hanya dicek di dalam tahun yang sama.
+
+    Blocking pakai prefix filtering: token tiap judul diurutkan dari yang
+    paling jarang, dan hanya prefix-nya yang di-index per (blok, token,
+    jumlah token). Dua judul dengan Jaccard >= threshold pasti berbagi
+    minimal satu token prefix dan jumlah token yang berdekatan, jadi hanya
+    pasangan dalam bucket itu yang diverifikasi. Tidak ada bucket yang
+    dibatasi/di-skip, jadi recall tidak berkurang; biaya bergantung pada
+    ukuran bucket, yang kecil karena token prefix adalah token paling jarang.
+    """
+    parent = list(range(len(records)))
+
+    # Varian judul: (index record, token set, blok kompatibilitas)
+    variants = []
+    exact_index = {}
+    block_ids = {}
+    for i, record in enumerate(records):
+        slug_base = slug_to_title(record.get('slug'))
+        titles = title_variants(record, slug_base)
+        numeric = frozenset()
+        if DIGIT_PATTERN.search(' '.join(titles)):
+            numeric = _numeric_tokens(token for title in titles for token in title.split())
+        tipe = (record.get('tipe') or '').lower()
+        # Blok di-intern jadi int supaya key bucket murah di-hash
+        block = block_ids.setdefault(
+            (tipe, numeric, _normalize_year(record.get('tahun'))), len(block_ids)
+        )
+
+        # Slug persis sama (show yang muncul di beberapa tahun) = show yang sama
+        key = record_key(record)
+        if key:
+            first = exact_index.setdefault(('slug', tipe, numeric, key), i)
+            if first != i:
+                _union(parent, first, i)
+
+        for title in titles:
+            first = exact_index.setdefault(('title', block, title), i)
+            if first != i:
+                _union(parent, first, i)
+            variants.append((i, frozenset(title.split()), block))
+
+    # Urutan global token untuk prefix: token jarang dulu (tie-break alfabet)
+    token_freq = {}
+    for _, tokens, _ in variants:
+        for token in tokens:
+            token_freq[token] = token_freq.get(token, 0) + 1
+    token_rank = {
+        token: rank for rank, token in
+        enumerate(sorted(token_freq, key=lambda token: (token_freq[token], token)))
+    }
+
+    buckets = {}
+    for i, tokens, block in variants:
+        size = len(tokens)
+        ordered = sorted(tokens, key=token_rank.__getitem__)
+        prefix = ordered[:size - math.ceil(threshold * size) + 1]
+
+        # Jaccard >= threshold hanya mungkin kalau jumlah token berdekatan
+        sizes = range(math.ceil(threshold * size), int(size / threshold) + 1)
+        for token in prefix:
+            for other_size in sizes:
+                bucket = buckets.get((block, token, other_size))
+                if not bucket:
+                    continue
+                for j, other in bucket:
+                    if len(tokens & other) >= threshold * len(tokens | other):
+                        _union(parent, i, j)
+            key = (block, token, size)
+            if key in buckets:
+                buckets[key].append((i, tokens))
+            else:
+                buckets[key] = [(i, tokens)]
+
+    groups = {}
+    for i in range(len(records)):
+        groups.setdefault(_find(parent, i), []).append(i)
+    return list(groups.values())
+
+
+def dedupe_anime_data(data, threshold=SIMILARITY_THRESHOLD):
+    """
+    Hapus duplikat show (beda tahun, varian slug, judul vs judul_english).
+    Return (data unik, mapping id -> id kanonik).
+    """
+    deduped = []
+    canonical_ids = {}
+
+    # Index membuat ratusan ribu tuple/set kecil; GC siklik di tengah
+    # proses hanya menambah waktu tanpa ada yang bisa dibebaskan
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        groups = find_duplicate_groups(data, threshold)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    for group in groups:
+        # Record paling lengkap jadi kanonik
+        canonical = max(
+            (data[i] for i in group),
+            key=lambda record: (record_richness(record), record_key(record))
+        )
+        canonical_id = record_key(canonical)
+        deduped.append(canonical)
+        for i in group:
+            key = record_key(data[i])
+            if key:
+                canonical_ids[key] = canonical_id
+
+    return deduped, canonical_ids
+
+
+def save_canonical_ids(canonical_ids, path=CANONICAL_IDS_FILE):
+    """Save mapping id -> id kanonik ke file JSON."""
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(canonical_ids, f, ensure_ascii=False, indent=2, sort_keys=True)
+        print(f"💾 Mapping id kanonik disimpan ke {path}")
+    except Exception as e:
+        print(f"❌ Gagal save mapping id kanonik: {e}")
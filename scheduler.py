@@ -0,0 +1,184 @@
+import json
+import os
+import hashlib
+from datetime import datetime, timedelta
+
+SCHEDULE_FILE = 'refresh_schedule.json'
+
+# Interval dasar per status (jam). 0 = refresh setiap run
+BASE_INTERVAL_HOURS = {
+    'airing': 0,
+    'upcoming': 24,
+    'finished': 24 * 7,
+}
+DEFAULT_INTERVAL_HOURS = 24
+MAX_INTERVAL_HOURS = 24 * 30
+
+# Field yang tidak ikut dihitung saat cek perubahan data
+VOLATILE_FIELDS = ('scraped_at', 'last_updated')
+
+
+def classify_status(status):
+    """Kelompokkan status show ke 'airing', 'upcoming', 'finished' atau 'unknown'."""
+    status = (status or '').lower()
+    if 'finished' in status or 'completed' in status:
+        return 'finished'
+    if 'not_yet' in status or 'not yet' in status or 'upcoming' in status:
+        return 'upcoming'
+    if 'airing' in status or 'ongoing' in status:
+        return 'airing'
+    return 'unknown'
+
+
+def record_fingerprint(record):
+    """Hash isi record (tanpa timestamp) untuk mendeteksi perubahan."""
+    stable = {k: v for k, v in record.items() if k not in VOLATILE_FIELDS}
+    payload = json.dumps(stable, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def refresh_interval(status, unchanged_runs):
+    """
+    Hitung interval refresh berikutnya.
+    Interval dasar dari status, digandakan setiap kali data tidak berubah
+    (dibatasi MAX_INTERVAL_HOURS).
+    """
+    base = BASE_INTERVAL_HOURS.get(classify_status(status), DEFAULT_INTERVAL_HOURS)
+    if base == 0:
+        return timedelta(0)
+    hours = min(base * (2 ** min(unchanged_runs, 8)), MAX_INTERVAL_HOURS)
+    return timedelta(hours=hours)
+
+
+def load_schedule(path=SCHEDULE_FILE):
+    """Load jadwal refresh dari file JSON."""
+    if not os.path.exists(path):
+        return {'shows': {}}
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            schedule = json.load(f)
+        schedule.setdefault('shows', {})
+        return schedule
+    except Exception as e:
+        print(f"❌ Gagal load jadwal refresh: {e}")
+        return {'shows': {}}
+
+
+def save_schedule(schedule, path=SCHEDULE_FILE):
+    """Save jadwal refresh ke file JSON."""
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(schedule, f, ensure_ascii=False, indent=2)
+        print(f"💾 Jadwal refresh disimpan ke {path}")
+    except Exception as e:
+        print(f"❌ Gagal save jadwal refresh: {e}")
+
+
+def schedule_key(record):
+    """
+    Key jadwal per (tahun, slug): show yang muncul di beberapa tahun punya
+    entry terpisah per tahun.
+    """
+    slug = record.get('slug') or record.get('url_detail')
+    if not slug:
+        return None
+    return f"{record.get('tahun')}/{slug}"
+
+
+def update_schedule(schedule, records, refreshed_years, now=None):
+    """
+    Update jadwal untuk setiap record yang baru di-scrape.
+    refreshed_years hanya boleh berisi tahun yang listing-nya lengkap: show
+    lama di tahun itu yang tidak muncul lagi dihapus, lalu jadwal tahunnya
+    di-reset ke next_refresh paling awal dari show-nya. Tahun yang hanya
+    di-fetch sebagian tetap jatuh tempo dan tidak di-prune.
+    Return jumlah show yang datanya berubah.
+    """
+    now = now or datetime.now()
+    shows = schedule.setdefault('shows', {})
+    years = schedule.setdefault('years', {})
+    refreshed_years = {int(year) for year in refreshed_years}
+    seen_keys = set()
+    changed = 0
+
+    for record in records:
+        key = schedule_key(record)
+        if not key:
+            continue
+        seen_keys.add(key)
+
+        fingerprint = record_fingerprint(record)
+        entry = shows.get(key, {})
+
+        if entry.get('fingerprint') == fingerprint:
+            unchanged_runs = entry.get('unchanged_runs', 0) + 1
+            last_changed = entry.get('last_changed', now.isoformat())
+        else:
+            unchanged_runs = 0
+            last_changed = now.isoformat()
+            changed += 1
+
+        interval = refresh_interval(record.get('status'), unchanged_runs)
+        shows[key] = {
+            'tahun': record.get('tahun'),
+            'status': record.get('status', ''),
+            'fingerprint': fingerprint,
+            'unchanged_runs': unchanged_runs,
+            'last_scraped': now.isoformat(),
+            'last_changed': last_changed,
+            'next_refresh': (now + interval).isoformat(),
+        }
+
+    # Hapus show yang hilang dari listing tahun yang baru di-refresh,
+    # supaya entry basi tidak membuat tahunnya jatuh tempo terus
+    for key in list(shows):
+        if key not in seen_keys and _entry_year(shows[key]) in refreshed_years:
+            del shows[key]
+
+    # Jadwal per tahun: satu fetch me-refresh semua show di tahun itu
+    for year in refreshed_years:
+        next_refreshes = [
+            entry['next_refresh'] for entry in shows.values()
+            if _entry_year(entry) == year
+        ]
+        years[str(year)] = {
+            'last_fetched': now.isoformat(),
+            'next_refresh': min(next_refreshes) if next_refreshes else now.isoformat(),
+        }
+
+    schedule['last_run'] = now.isoformat()
+    return changed
+
+
+def _entry_year(entry):
+    try:
+        return int(entry.get('tahun'))
+    except (TypeError, ValueError):
+        return None
+
+
+def is_due(entry, now=None):
+    """Cek apakah show sudah waktunya di-refresh."""
+    now = now or datetime.now()
+    try:
+        return datetime.fromisoformat(entry['next_refresh']) <= now
+    except (KeyError, TypeError, ValueError):
+        return True
+
+
+def get_due_years(schedule, target_years, now=None):
+    """
+    Pilih tahun yang perlu di-fetch run ini: tahun yang belum pernah
+    di-scrape, atau yang jadwal tahunnya sudah jatuh tempo.
+    """
+    now = now or datetime.now()
+    years = schedule.get('years', {})
+
+    due_years = []
+    for year in target_years:
+        entry = years.get(str(year))
+        if not entry or is_due(entry, now):
+            due_years.append(year)
+
+    return due_years
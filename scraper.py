@@ -1,10 +1,12 @@
 import asyncio
 from playwright.async_api import async_playwright
 import json
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse, parse_qs
 import re
 import os
 from datetime import datetime
+from scheduler import load_schedule, save_schedule, update_schedule, get_due_years
+from dedup import dedupe_anime_data, save_canonical_ids
 
 async def scrape_kickass_anime_all_years():
     """
@@ -22,6 +24,7 @@ async def scrape_kickass_anime_all_years():
         )
         
         page = await context.new_page()
+        run_state = create_run_state(page)
         
         try:
             base_url = "https://kickass-anime.ru"
@@ -39,7 +42,7 @@ async def scrape_kickass_anime_all_years():
             
             # Extract data dengan FILTER YEAR
             print("🔍 Extract data dengan filter tahun...")
-            anime_data = await extract_data_with_year_filter(page, base_url, current_year)
+            anime_data, _ = await extract_data_with_year_filter(page, base_url, current_year, run_state)
             
             if anime_data:
                 print(f"🎉 Berhasil extract {len(anime_data)} anime untuk tahun {current_year}")
@@ -80,105 +83,368 @@ async def get_current_filtered_year(page):
         print(f"❌ Gagal detect tahun: {e}")
         return 2024
 
-async def extract_data_with_year_filter(page, base_url, target_year):
+def create_run_state(page):
     """
-    Extract data anime dengan filter tahun yang spesifik.
+    Siapkan state per-run untuk extraction engine dan pasang listener
+    untuk menangkap response API (JSON) yang berisi data show.
+    Harus dipanggil sebelum page.goto pertama.
     """
+    run_state = {
+        'api_responses': [],       # response API yang berisi list show
+        'active_strategy': None,   # strategi tercepat yang terbukti berhasil
+        'year_filter_applied': False
+    }
+    
+    async def on_response(response):
+        try:
+            if response.request.resource_type not in ('xhr', 'fetch'):
+                return
+            if 'json' not in response.headers.get('content-type', ''):
+                return
+            payload = await response.json()
+            shows = find_show_list(payload)
+            if shows:
+                run_state['api_responses'].append({
+                    'url': response.url,
+                    'post_data': response.request.post_data or '',
+                    'meta': find_pagination_meta(payload),
+                    'shows': shows
+                })
+        except Exception:
+            # Response yang bukan data show diabaikan saja
+            pass
+    
+    page.on("response", on_response)
+    return run_state
+
+def find_show_list(payload):
+    """Cari list show (dict dengan slug & title) di dalam payload JSON API."""
+    candidates = []
+    if isinstance(payload, list):
+        candidates.append(payload)
+    elif isinstance(payload, dict):
+        for key in ('result', 'shows', 'data', 'items'):
+            value = payload.get(key)
+            if isinstance(value, list):
+                candidates.append(value)
+            elif isinstance(value, dict) and isinstance(value.get('shows'), list):
+                candidates.append(value['shows'])
+    
+    shows = []
+    for candidate in candidates:
+        for item in candidate:
+            if isinstance(item, dict) and item.get('slug') and item.get('title'):
+                shows.append(item)
+    return shows
+
+def find_pagination_meta(payload):
+    """Ambil field paginasi (total, page, max page, next) dari payload JSON API."""
+    if not isinstance(payload, dict):
+        return {}
+    
+    meta = {}
+    for source in (payload, payload.get('meta'), payload.get('pagination'), payload.get('data')):
+        if isinstance(source, dict):
+            for key, value in source.items():
+                if not isinstance(value, (list, dict)):
+                    meta.setdefault(key, value)
+    return meta
+
+def parse_int(value):
+    """Konversi ke int (API/DOM kadang mengirim tahun/total sebagai string)."""
     try:
-        # Tunggu sampai window.KAA tersedia
-        await page.wait_for_function('window.KAA && window.KAA.data', timeout=15000)
-        
-        # Execute JavaScript dengan FILTER YEAR
-        js_code = f"""
-        () => {{
-            try {{
-                if (window.KAA && window.KAA.data && window.KAA.data[0] && window.KAA.data[0].shows) {{
-                    const allShows = window.KAA.data[0].shows;
-                    console.log('Total shows in KAA:', allShows.length);
-                    
-                    // FILTER BY YEAR - ini yang penting!
-                    const filteredShows = allShows.filter(show => show.year === {target_year});
-                    console.log('Shows for year {target_year}:', filteredShows.length);
-                    
-                    return filteredShows.map(show => ({{
-                        slug: show.slug || '',
-                        title: show.title || '',
-                        title_en: show.title_en || '',
-                        year: show.year || 0,
-                        type: show.type || '',
-                        status: show.status || '',
-                        synopsis: show.synopsis || '',
-                        genres: show.genres || [],
-                        locales: show.locales || [],
-                        episode_duration: show.episode_duration || 0,
-                        poster: show.poster || {{}},
-                        watch_uri: show.watch_uri || ''
-                    }}));
-                }}
-                return null;
-            }} catch (e) {{
-                console.error('Error in KAA extraction:', e);
-                return null;
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+def is_year_filtered_request(url, post_data, target_year):
+    """Cek apakah request API memakai filter tahun target (query string atau body)."""
+    query = parse_qs(urlparse(url).query)
+    for key, values in query.items():
+        if 'year' in key.lower() and str(target_year) in values:
+            return True
+    return re.search(rf'"?year"?\s*[:=]\s*"?{target_year}\b', post_data or '') is not None
+
+def is_complete_listing(meta, shows_count):
+    """
+    Cek apakah response API sudah memuat seluruh listing (tidak ada halaman
+    berikutnya). Kalau field paginasi tidak ada, dianggap tidak lengkap.
+    """
+    if meta.get('next') or meta.get('next_page_url'):
+        return False
+    
+    def first_number(keys):
+        for key in keys:
+            if str(meta.get(key, '')).isdigit():
+                return int(meta[key])
+        return None
+    
+    # Field halaman dicek dulu; 'count' sengaja tidak dipakai karena sering
+    # berarti jumlah item di halaman ini, bukan total listing
+    current = first_number(('page', 'current_page', 'currentPage'))
+    last = first_number(('maxPage', 'max_page', 'total_pages', 'totalPages', 'last_page', 'lastPage', 'pages'))
+    if current is not None and last is not None:
+        return current >= last
+    
+    total = first_number(('total', 'total_count', 'totalCount', 'total_items', 'totalItems'))
+    if total is not None:
+        return total <= shows_count
+    
+    return False
+
+async def extract_via_api(page, base_url, target_year, run_state):
+    """
+    Strategi 1 (tercepat): pakai response API yang sudah tertangkap
+    selama halaman load, tanpa query tambahan ke halaman.
+    Hanya diterima kalau response-nya listing yang difilter tahun target
+    dan tidak punya halaman berikutnya; selain itu fallback ke strategi lain.
+    """
+    for captured in run_state['api_responses']:
+        if not is_year_filtered_request(captured['url'], captured['post_data'], target_year):
+            continue
+        
+        shows = captured['shows']
+        if any(parse_int(show.get('year')) != target_year for show in shows):
+            continue
+        
+        if is_complete_listing(captured['meta'], len(shows)):
+            return shows, True
+    
+    return None
+
+async def extract_via_kaa(page, base_url, target_year, run_state):
+    """
+    Strategi 2: baca snapshot state JavaScript window.KAA.data[0].shows.
+    Snapshot hanya lengkap kalau filter tahun di UI diterapkan dan listing
+    tidak punya halaman berikutnya; selain itu hasilnya ditandai parsial.
+    """
+    # Tunggu sampai window.KAA tersedia
+    await page.wait_for_function('window.KAA && window.KAA.data', timeout=15000)
+    
+    # Execute JavaScript dengan FILTER YEAR
+    js_code = f"""
+    () => {{
+        try {{
+            if (window.KAA && window.KAA.data && window.KAA.data[0] && window.KAA.data[0].shows) {{
+                const allShows = window.KAA.data[0].shows;
+                console.log('Total shows in KAA:', allShows.length);
+                
+                // FILTER BY YEAR - ini yang penting!
+                const filteredShows = allShows.filter(show => show.year === {target_year});
+                console.log('Shows for year {target_year}:', filteredShows.length);
+                
+                return filteredShows.map(show => ({{
+                    slug: show.slug || '',
+                    title: show.title || '',
+                    title_en: show.title_en || '',
+                    year: show.year || 0,
+                    type: show.type || '',
+                    status: show.status || '',
+                    synopsis: show.synopsis || '',
+                    genres: show.genres || [],
+                    locales: show.locales || [],
+                    episode_duration: show.episode_duration || 0,
+                    poster: show.poster || {{}},
+                    watch_uri: show.watch_uri || ''
+                }}));
             }}
+            return null;
+        }} catch (e) {{
+            console.error('Error in KAA extraction:', e);
+            return null;
         }}
-        """
+    }}
+    """
+    
+    shows = await page.evaluate(js_code)
+    if not shows:
+        return None
+    
+    complete = run_state['year_filter_applied'] and not await find_next_page_button(page)
+    return shows, complete
+
+async def extract_via_dom(page, base_url, target_year, run_state):
+    """
+    Strategi 3 (paling lambat): crawl DOM .show-item per halaman pagination.
+    Hanya butuh filter tahun sudah diterapkan di UI. Crawl yang terpotong
+    (timeout atau batas halaman) ditandai parsial.
+    """
+    if not run_state['year_filter_applied']:
+        print("  ⚠️  Filter tahun tidak diterapkan, crawl DOM di-skip")
+        return None
+    
+    shows = []
+    page_number = 1
+    max_pages_per_year = 20  # Safety limit untuk GitHub Actions
+    complete = False
+    
+    while page_number <= max_pages_per_year:
+        print(f"  📄 Halaman {page_number} - Tahun {target_year}")
+        
+        try:
+            await page.wait_for_selector(".show-item", timeout=30000)
+        except Exception:
+            print("  ⏰ Timeout menunggu item anime")
+            break
+        
+        anime_items = await page.query_selector_all(".show-item")
+        if not anime_items:
+            break
+        
+        for item in anime_items:
+            try:
+                detail_link_element = await item.query_selector("h2.show-title a")
+                if not detail_link_element:
+                    continue
+                
+                detail_url_path = await detail_link_element.get_attribute("href") or ""
+                title_element = await item.query_selector("h2.show-title span")
+                title = await title_element.inner_text() if title_element else ""
+                
+                # Ambil URL Poster dari background-image
+                poster_url = ""
+                poster_div = await item.query_selector(".v-image__image--cover")
+                if poster_div:
+                    poster_style = await poster_div.get_attribute("style")
+                    if poster_style and 'url("' in poster_style:
+                        poster_url = urljoin(base_url, poster_style.split('url("')[1].split('")')[0])
+                
+                shows.append({
+                    'slug': detail_url_path.strip('/'),
+                    'title': title.strip(),
+                    'year': target_year,
+                    'poster_url': poster_url
+                })
+            except Exception as e:
+                print(f"  ❌ Gagal baca item: {e}")
         
-        raw_data = await page.evaluate(js_code)
+        # Cek halaman berikutnya
+        next_button = await find_next_page_button(page)
+        if not next_button:
+            complete = True
+            break
         
-        if not raw_data:
-            print(f"❌ Tidak ada data untuk tahun {target_year}")
-            return None
+        page_number += 1
+        await next_button.click()
+        await asyncio.sleep(3)
+    
+    if not complete:
+        print(f"  ⚠️  Crawl DOM terpotong di halaman {page_number}, hasil parsial")
+    
+    return (shows, complete) if shows else None
+
+async def find_next_page_button(page):
+    """Cari tombol halaman berikutnya yang masih aktif di pagination."""
+    for btn in await page.query_selector_all(".v-pagination__navigation"):
+        if await btn.query_selector(".mdi-chevron-right") and not await btn.get_attribute("disabled"):
+            return btn
+    return None
+
+# Urutan strategi extraction: tercepat dulu, fallback ke yang lebih lambat
+EXTRACTION_STRATEGIES = [
+    ('api', extract_via_api),
+    ('kaa', extract_via_kaa),
+    ('dom', extract_via_dom),
+]
+
+def normalize_show(item, base_url):
+    """
+    Ubah show mentah dari strategi manapun ke satu format record.
+    """
+    slug = item.get('slug') or ''
+    
+    # Build URLs
+    detail_url = f"{base_url}/{slug}" if slug else ""
+    
+    watch_url = None
+    if item.get('watch_uri'):
+        watch_url = f"{base_url}{item['watch_uri']}"
+    
+    # Build poster URL
+    poster_url = item.get('poster_url') or "Tidak tersedia"
+    poster = item.get('poster')
+    if isinstance(poster, dict) and poster.get('hq'):
+        poster_url = f"https://kickass-anime.ru/image/poster/{poster['hq']}"
+    
+    synopsis = item.get('synopsis') or ''
+    
+    return {
+        "judul": item.get('title') or '',
+        "judul_english": item.get('title_en') or '',
+        "tahun": parse_int(item.get('year')),
+        "tipe": item.get('type') or '',
+        "status": item.get('status') or '',
+        "sinopsis": synopsis[:200] + "..." if len(synopsis) > 200 else synopsis,
+        "genre": item.get('genres') or [],
+        "bahasa": item.get('locales') or [],
+        "durasi_episode": item.get('episode_duration') or 0,
+        "url_poster": poster_url,
+        "url_detail": detail_url,
+        "url_watch": watch_url,
+        "slug": slug,
+        "scraped_at": datetime.now().isoformat()
+    }
+
+async def extract_data_with_year_filter(page, base_url, target_year, run_state):
+    """
+    Extract data anime untuk satu tahun lewat chain strategi.
+    Strategi yang terakhir berhasil dicoba lebih dulu, sisanya jadi fallback.
+    Return (data, complete): complete=False berarti data hanya sebagian dari
+    listing tahun itu (strategi lengkap tidak ada yang berhasil).
+    """
+    strategies = sorted(
+        EXTRACTION_STRATEGIES,
+        key=lambda strategy: strategy[0] != run_state['active_strategy']
+    )
+    
+    partial_data = None
+    for name, strategy in strategies:
+        try:
+            result = await strategy(page, base_url, target_year, run_state)
+        except Exception as e:
+            print(f"⚠️  Strategi '{name}' gagal: {e}")
+            continue
         
-        print(f"📊 Mendapatkan {len(raw_data)} anime untuk tahun {target_year}")
+        if not result:
+            print(f"⚠️  Strategi '{name}' tidak menemukan data untuk tahun {target_year}")
+            continue
         
+        raw_data, complete = result
         processed_data = []
         for item in raw_data:
             try:
+                anime_info = normalize_show(item, base_url)
+                
                 # Validasi tahun - pastikan sesuai filter
-                if item.get('year') != target_year:
+                if anime_info['tahun'] != target_year:
                     continue
                 
-                # Build URLs
-                detail_url = f"{base_url}/{item['slug']}" if item.get('slug') else ""
-                
-                # Build watch URL
-                watch_url = None
-                if item.get('watch_uri'):
-                    watch_url = f"{base_url}{item['watch_uri']}"
-                
-                # Build poster URL
-                poster_url = "Tidak tersedia"
-                if item.get('poster') and item['poster'].get('hq'):
-                    poster_filename = item['poster']['hq']
-                    poster_url = f"https://kickass-anime.ru/image/poster/{poster_filename}"
-                
-                anime_info = {
-                    "judul": item['title'],
-                    "judul_english": item['title_en'],
-                    "tahun": item['year'],
-                    "tipe": item['type'],
-                    "status": item['status'],
-                    "sinopsis": item['synopsis'][:200] + "..." if item['synopsis'] and len(item['synopsis']) > 200 else item['synopsis'],
-                    "genre": item['genres'],
-                    "bahasa": item['locales'],
-                    "durasi_episode": item['episode_duration'],
-                    "url_poster": poster_url,
-                    "url_detail": detail_url,
-                    "url_watch": watch_url,
-                    "slug": item['slug'],
-                    "scraped_at": datetime.now().isoformat()
-                }
                 processed_data.append(anime_info)
                 
             except Exception as e:
                 print(f"❌ Gagal process item: {e}")
                 continue
         
-        return processed_data
+        if not complete:
+            # Simpan sebagai cadangan, coba strategi berikutnya yang mungkin lengkap
+            print(f"⚠️  Strategi '{name}' hanya dapat sebagian listing tahun {target_year}")
+            if partial_data is None or len(processed_data) > len(partial_data):
+                partial_data = processed_data
+            continue
         
-    except Exception as e:
-        print(f"❌ Gagal extract data dengan filter: {e}")
-        return None
+        if run_state['active_strategy'] != name:
+            print(f"🧭 Memakai strategi '{name}'")
+            run_state['active_strategy'] = name
+        
+        print(f"📊 Mendapatkan {len(processed_data)} anime untuk tahun {target_year}")
+        return processed_data, True
+    
+    if partial_data:
+        print(f"📊 Mendapatkan {len(partial_data)} anime (parsial) untuk tahun {target_year}")
+        return partial_data, False
+    
+    print(f"❌ Tidak ada data untuk tahun {target_year}")
+    return None, False
 
 async def scrape_multiple_years():
     """
@@ -196,38 +462,61 @@ async def scrape_multiple_years():
         )
         
         page = await context.new_page()
+        run_state = create_run_state(page)
         
         try:
             base_url = "https://kickass-anime.ru"
             all_data = []
             
-            # Tahun yang ingin di-scrape (dari terbaru)
-            target_years = [2024, 2023, 2022, 2021, 2020]
+            # Deteksi tahun yang tersedia di filter (dari terbaru)
+            await page.goto(f"{base_url}/anime", wait_until="domcontentloaded", timeout=60000)
+            target_years = sorted(await get_available_years(page), reverse=True)
+            
+            # Hanya fetch tahun yang jadwalnya sudah jatuh tempo (lihat scheduler.py)
+            schedule = load_schedule()
+            if os.environ.get('FULL_REFRESH') == '1':
+                due_years = target_years
+            else:
+                due_years = get_due_years(schedule, target_years)
+            
+            skipped_years = [year for year in target_years if year not in due_years]
+            print(f"📅 Tahun jatuh tempo: {due_years}")
+            if skipped_years:
+                print(f"⏩ Tahun di-skip (belum jatuh tempo): {skipped_years}")
             
-            for year in target_years:
+            refreshed_years = []
+            
+            for year in due_years:
                 print(f"\n{'='*50}")
                 print(f"🎬 MEMPROSES TAHUN: {year}")
                 print(f"{'='*50}")
                 
                 try:
+                    # Response API dari tahun sebelumnya tidak dipakai lagi
+                    run_state['api_responses'].clear()
+                    
                     # Pergi ke halaman anime
                     await page.goto(f"{base_url}/anime", wait_until="domcontentloaded", timeout=60000)
                     
-                    # Apply filter tahun
-                    success = await apply_year_filter(page, year)
-                    if not success:
-                        print(f"❌ Gagal apply filter untuk tahun {year}")
-                        continue
+                    # Apply filter tahun (snapshot KAA tetap bisa dipakai kalau gagal)
+                    run_state['year_filter_applied'] = await apply_year_filter(page, year)
+                    if not run_state['year_filter_applied']:
+                        print(f"⚠️  Gagal apply filter untuk tahun {year}, coba strategi tanpa filter UI")
                     
                     # Tunggu data load
                     await page.wait_for_selector(".show-item", timeout=15000)
                     
                     # Extract data dengan filter
-                    year_data = await extract_data_with_year_filter(page, base_url, year)
+                    year_data, complete = await extract_data_with_year_filter(page, base_url, year, run_state)
                     
                     if year_data:
                         all_data.extend(year_data)
-                        print(f"✅ Tahun {year}: {len(year_data)} anime")
+                        # Hanya listing lengkap yang boleh menggantikan data lama tahun ini
+                        if complete:
+                            refreshed_years.append(year)
+                            print(f"✅ Tahun {year}: {len(year_data)} anime")
+                        else:
+                            print(f"⚠️  Tahun {year}: {len(year_data)} anime (parsial, data lama dipertahankan)")
                     else:
                         print(f"⚠️  Tidak ada data untuk tahun {year}")
                     
@@ -239,6 +528,28 @@ async def scrape_multiple_years():
                     continue
             
             if all_data:
+                changed = update_schedule(schedule, all_data, refreshed_years)
+                print(f"🔁 Show yang berubah: {changed}/{len(all_data)}")
+                save_schedule(schedule)
+            
+            # Gabung dengan data lama: tahun yang listing-nya lengkap diganti
+            # penuh, tahun parsial hanya menimpa show yang ikut ter-fetch
+            previous_data = load_anime_data("multiple_years")
+            fetched_keys = {(d.get('slug'), d.get('tahun')) for d in all_data}
+            kept_data = [
+                d for d in previous_data
+                if d.get('tahun') not in refreshed_years
+                and (d.get('slug'), d.get('tahun')) not in fetched_keys
+            ]
+            all_data = kept_data + all_data
+            
+            # Buang duplikat (beda tahun, varian slug/judul)
+            total_before = len(all_data)
+            all_data, canonical_ids = dedupe_anime_data(all_data)
+            print(f"🧹 Duplikat dibuang: {total_before - len(all_data)}")
+            
+            if all_data:
+                save_canonical_ids(canonical_ids)
                 await save_anime_data(all_data, "multiple_years")
             
             return all_data
@@ -249,28 +560,81 @@ async def scrape_multiple_years():
         finally:
             await browser.close()
 
+# Tombol dan opsi tahun: layout chip dan layout dropdown list
+YEAR_BUTTON_SELECTORS = ["button:has-text('Year')", ".v-btn:has-text('Year')"]
+YEAR_OPTION_SELECTORS = ['.v-chip .v-chip__content:has-text("{year}")', '.v-list-item:has-text("{year}")']
+
+async def open_year_filter(page):
+    """Klik tombol Year. Return True kalau tombolnya ketemu."""
+    for selector in YEAR_BUTTON_SELECTORS:
+        year_btn = await page.query_selector(selector)
+        if year_btn:
+            await year_btn.click()
+            await asyncio.sleep(2)
+            return True
+    return False
+
+async def close_year_filter(page):
+    """Tutup dropdown/dialog filter tahun."""
+    close_btn = await page.query_selector("button:has-text('Close')")
+    if close_btn:
+        await close_btn.click()
+    else:
+        await page.keyboard.press("Escape")
+
+async def get_available_years(page):
+    """
+    Detect tahun yang tersedia di filter secara otomatis.
+    Fallback ke tahun sekarang sampai 2000 kalau gagal.
+    """
+    print("🔍 Mendeteksi tahun yang tersedia...")
+    
+    try:
+        await page.wait_for_selector(", ".join(YEAR_BUTTON_SELECTORS), timeout=30000)
+        if await open_year_filter(page):
+            available_years = set()
+            for selector in ('.v-chip .v-chip__content', '.v-list-item'):
+                for item in await page.query_selector_all(selector):
+                    year_text = (await item.inner_text()).strip()
+                    
+                    # Filter hanya yang angka dan dalam range reasonable
+                    if year_text.isdigit() and 1960 <= int(year_text) <= datetime.now().year + 1:
+                        available_years.add(int(year_text))
+            
+            await close_year_filter(page)
+            await asyncio.sleep(1)
+            
+            if available_years:
+                print(f"✅ Tahun tersedia: {sorted(available_years)}")
+                return sorted(available_years)
+            
+    except Exception as e:
+        print(f"❌ Gagal detect tahun: {e}")
+    
+    default_years = list(range(2000, datetime.now().year + 1))
+    print(f"⚠️  Menggunakan tahun default: {default_years[0]}-{default_years[-1]}")
+    return default_years
+
 async def apply_year_filter(page, year):
     """
-    Apply filter tahun di UI.
+    Apply filter tahun di UI (mendukung layout chip maupun dropdown list).
     """
     try:
         # Klik tombol Year
-        year_btn = await page.query_selector("button:has-text('Year')")
-        if not year_btn:
+        if not await open_year_filter(page):
             print("❌ Tombol Year tidak ditemukan")
             return False
         
-        await year_btn.click()
-        await asyncio.sleep(2)
-        
         # Cari dan klik tahun yang diinginkan
-        year_option = await page.query_selector(f'.v-chip .v-chip__content:has-text("{year}")')
+        year_option = None
+        for selector in YEAR_OPTION_SELECTORS:
+            year_option = await page.query_selector(selector.format(year=year))
+            if year_option:
+                break
+        
         if not year_option:
             print(f"❌ Opsi tahun {year} tidak ditemukan")
-            # Tutup dropdown
-            close_btn = await page.query_selector("button:has-text('Close')")
-            if close_btn:
-                await close_btn.click()
+            await close_year_filter(page)
             return False
         
         await year_option.click()
@@ -288,6 +652,20 @@ async def apply_year_filter(page, year):
         print(f"❌ Gagal apply filter: {e}")
         return False
 
+def load_anime_data(source):
+    """Load anime data dari JSON file hasil run sebelumnya."""
+    filename = f'anime_data_{source}.json'
+    
+    if not os.path.exists(filename):
+        return []
+    
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"❌ Gagal load data lama: {e}")
+        return []
+
 async def save_anime_data(data, source):
     """Save anime data to JSON file."""
     filename = f'anime_data_{source}.json'
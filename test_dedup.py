@@ -0,0 +1,101 @@
+from dedup import dedupe_anime_data, normalize_title, slug_to_title
+
+
+def anime(slug, judul, tahun, tipe='TV', **extra):
+    return {'slug': slug, 'judul': judul, 'tahun': tahun, 'tipe': tipe, **extra}
+
+
+def canonical_pairs(records):
+    _, canonical_ids = dedupe_anime_data(records)
+    return {key: value for key, value in canonical_ids.items() if key != value}
+
+
+def test_normalize_title_unifies_season_and_part_markers():
+    assert normalize_title('Attack on Titan: 2nd Season') == 'attack on titan s2'
+    assert normalize_title('Attack on Titan Season 2') == 'attack on titan s2'
+    assert normalize_title('Shingeki no Kyojin Season 3 Part 2') == 'shingeki no kyojin s3 p2'
+
+
+def test_normalize_title_strips_accents_and_punctuation():
+    assert normalize_title('Pokémon: Mezase Pokémon Master!') == 'pokemon mezase pokemon master'
+
+
+def test_normalize_title_keeps_type_markers():
+    assert normalize_title('Hellsing (OVA)') == 'hellsing ova'
+
+
+def test_slug_to_title_drops_hash_suffix():
+    assert slug_to_title('one-piece-0948') == 'one piece'
+
+
+def test_same_slug_across_years_is_merged():
+    records = [
+        anime('one-piece-0948', 'One Piece', 1999, status='finished_airing'),
+        anime('one-piece-0948', 'One Piece', 2000),
+    ]
+    deduped, canonical_ids = dedupe_anime_data(records)
+
+    assert len(deduped) == 1
+    assert canonical_ids == {'one-piece-0948': 'one-piece-0948'}
+
+
+def test_remakes_with_same_title_and_different_hash_stay_separate():
+    records = [
+        anime('urusei-yatsura-a1b2', 'Urusei Yatsura', 1981),
+        anime('urusei-yatsura-c3d4', 'Urusei Yatsura', 2022),
+        anime('fruits-basket-1111', 'Fruits Basket', 2001),
+        anime('fruits-basket-2222', 'Fruits Basket', 2019),
+    ]
+    deduped, _ = dedupe_anime_data(records)
+
+    assert len(deduped) == 4
+
+
+def test_different_seasons_stay_separate():
+    records = [
+        anime('kaguya-sama-1a2b', 'Kaguya-sama wa Kokurasetai', 2019,
+              judul_english='Kaguya-sama: Love is War'),
+        anime('kaguya-sama-3c4d', 'Kaguya-sama wa Kokurasetai?', 2019,
+              judul_english='Kaguya-sama: Love is War Season 2'),
+    ]
+
+    assert canonical_pairs(records) == {}
+
+
+def test_different_types_stay_separate():
+    records = [
+        anime('hellsing-cc33', 'Hellsing', 2001, tipe='TV'),
+        anime('hellsing-dd44', 'Hellsing', 2001, tipe='OVA'),
+    ]
+
+    assert canonical_pairs(records) == {}
+
+
+def test_judul_and_judul_english_variants_are_merged():
+    records = [
+        anime('shingeki-no-kyojin-1111', 'Shingeki no Kyojin', 2013,
+              judul_english='Attack on Titan', status='finished_airing'),
+        anime('attack-on-titan-2222', 'Attack on Titan', 2013),
+    ]
+
+    assert canonical_pairs(records) == {'attack-on-titan-2222': 'shingeki-no-kyojin-1111'}
+
+
+def test_near_duplicate_titles_are_merged():
+    records = [
+        anime('sword-art-online-alicization-aaaa', 'Sword Art Online: Alicization', 2018,
+              status='finished_airing'),
+        anime('sao-alicization-bbbb', 'Sword Art Online Alicization (Dub)', 2018),
+    ]
+
+    assert canonical_pairs(records) == {'sao-alicization-bbbb': 'sword-art-online-alicization-aaaa'}
+
+
+def test_canonical_record_is_the_most_complete_one():
+    records = [
+        anime('bleach-aaaa', 'Bleach', 2004),
+        anime('bleach-aaaa', 'Bleach', 2005, status='finished_airing', genre=['Action']),
+    ]
+    deduped, _ = dedupe_anime_data(records)
+
+    assert deduped == [records[1]]
@@ -0,0 +1,74 @@
+from datetime import datetime, timedelta
+
+from scheduler import (
+    MAX_INTERVAL_HOURS,
+    get_due_years,
+    refresh_interval,
+    update_schedule,
+)
+
+NOW = datetime(2026, 1, 1)
+
+
+def show(slug, tahun, status='finished_airing', **extra):
+    return {'slug': slug, 'tahun': tahun, 'status': status, **extra}
+
+
+def test_refresh_interval_doubles_until_cap():
+    assert refresh_interval('finished_airing', 0) == timedelta(days=7)
+    assert refresh_interval('finished_airing', 1) == timedelta(days=14)
+    assert refresh_interval('finished_airing', 2) == timedelta(days=28)
+    assert refresh_interval('finished_airing', 3) == timedelta(hours=MAX_INTERVAL_HOURS)
+    assert refresh_interval('finished_airing', 50) == timedelta(hours=MAX_INTERVAL_HOURS)
+
+
+def test_airing_shows_are_due_every_run():
+    assert refresh_interval('currently_airing', 5) == timedelta(0)
+
+
+def test_unchanged_show_counts_unchanged_runs():
+    schedule = {'shows': {}}
+    update_schedule(schedule, [show('a', 2020)], [2020], NOW)
+    changed = update_schedule(schedule, [show('a', 2020)], [2020], NOW + timedelta(days=7))
+
+    assert changed == 0
+    assert schedule['shows']['2020/a']['unchanged_runs'] == 1
+
+
+def test_year_is_due_after_earliest_show_refresh():
+    schedule = {'shows': {}}
+    update_schedule(schedule, [show('a', 2020), show('b', 2020, 'not_yet_aired')], [2020], NOW)
+
+    assert get_due_years(schedule, [2020, 2021], NOW + timedelta(hours=1)) == [2021]
+    assert get_due_years(schedule, [2020, 2021], NOW + timedelta(days=1)) == [2020, 2021]
+
+
+def test_complete_refresh_prunes_missing_shows():
+    schedule = {'shows': {}}
+    update_schedule(schedule, [show('a', 2020), show('b', 2020)], [2020], NOW)
+    update_schedule(schedule, [show('a', 2020)], [2020], NOW + timedelta(days=8))
+
+    assert list(schedule['shows']) == ['2020/a']
+    assert get_due_years(schedule, [2020], NOW + timedelta(days=9)) == []
+
+
+def test_partial_fetch_does_not_prune_or_reset_year():
+    schedule = {'shows': {}}
+    update_schedule(schedule, [show('a', 2020), show('b', 2020)], [2020], NOW)
+    later = NOW + timedelta(days=8)
+    update_schedule(schedule, [show('a', 2020)], [], later)
+
+    assert set(schedule['shows']) == {'2020/a', '2020/b'}
+    assert get_due_years(schedule, [2020], later) == [2020]
+
+
+def test_show_listed_under_several_years_keeps_one_entry_per_year():
+    schedule = {'shows': {}}
+    records = [show('a', 2020), show('a', 2021)]
+    update_schedule(schedule, records, [2020, 2021], NOW)
+    changed = update_schedule(schedule, records, [2020, 2021], NOW + timedelta(days=7))
+
+    assert changed == 0
+    assert schedule['shows']['2020/a']['unchanged_runs'] == 1
+    assert schedule['shows']['2021/a']['unchanged_runs'] == 1
+    assert set(schedule['years']) == {'2020', '2021'}